@@ -7,6 +7,7 @@ from autologic import algorithms
 from autologic.algorithms._base import HeatGenerator
 
 _registry: Dict[str, Type[HeatGenerator]] = {}
+_discovered = False
 
 
 def register(cls: Type[HeatGenerator]) -> Type[HeatGenerator]:
@@ -54,12 +55,20 @@ def _iter_algorithm_module_names() -> Iterable[str]:
 
 
 def _discover_algorithms() -> None:
-    """Import algorithm modules so that @register runs."""
+    """Import algorithm modules so that @register runs.
+
+    The package contents do not change while the app is running, so the scan
+    only happens on the first call; later calls reuse the populated registry.
+    """
+    global _discovered
+    if _discovered:
+        return
     pkg = algorithms
     for module_name in _iter_algorithm_module_names():
         if module_name in ("_base", "_registry", "__init__"):
             continue
         importlib.import_module(f"{pkg.__name__}.{module_name}")
+    _discovered = True
 
 
 def get_algorithms() -> Dict[str, Type[HeatGenerator]]:
@@ -25,8 +25,29 @@ class Randomizer(HeatGenerator):
         rules_satisfied = False
         iteration = -1
         rejection_reasons = {}
+        # checks are deterministic for a given class-to-heat layout, so remember how each
+        # failed layout was rejected and replay that for any redraw of one of them
+        categories = list(event.categories.values())
+        rejected_layouts = {}
         self._notify("start", {"max_iterations": event.max_iterations})
 
+        # qualifications and class membership don't change while heats are generated, so
+        # each class's qualified headcount per role is tallied once and heats add up their
+        # classes instead of rescanning participants
+        category_role_counts = {
+            c: {
+                role: sum(1 for p in c.participants if getattr(p, role, False))
+                for role in utils.roles_and_minima()
+            }
+            for c in categories
+        }
+
+        # heat bounds are fixed for the event, so format their description once
+        heat_bounds_message = (
+            f"\n  Heat size must be {event.mean_heat_size} +/- {event.max_heat_size_delta}"
+            f"\n  Novice count must be {event.mean_heat_novice_count} +/- {event.max_heat_novice_delta}"
+        )
+
         def record_rejection_reason(reason: str) -> None:
             """Track how often each rejection reason occurs.
 
@@ -52,12 +73,19 @@ class Randomizer(HeatGenerator):
             self.randomize_heats(event)
             event.verbose = True
 
-            print(
-                f"\n  Heat size must be {event.mean_heat_size} +/- {event.max_heat_size_delta}"
-            )
-            print(
-                f"  Novice count must be {event.mean_heat_novice_count} +/- {event.max_heat_novice_delta}"
-            )
+            # write multi-line blocks in one call to keep console writes per iteration low
+            print(heat_bounds_message)
+
+            layout = tuple(c.heat for c in categories)
+            if layout in rejected_layouts:
+                rules_satisfied = False
+                reason, message, notice = rejected_layouts[layout]
+                record_rejection_reason(reason)
+                print(f"{message}\n    (layout already rejected; checks skipped)")
+                if notice is not None:
+                    self._notify("heat_rejected", {"iteration": iteration, **notice})
+                continue
+            rejection = None
 
             # clear assignments from the previous iteration
             # TODO: make a p.clear_assignment() function that handles this and other logic trees
@@ -78,11 +106,11 @@ class Randomizer(HeatGenerator):
                     skip_iteration = True
                     reason = "heat size out of bounds"
                     record_rejection_reason(reason)
-                    print(f"\n    Heat {h} rejected: {reason}")
-                    self._notify(
-                        "heat_rejected",
-                        {"iteration": iteration, "heat": h.number, "reason": reason},
-                    )
+                    message = f"\n    Heat {h} rejected: {reason}"
+                    notice = {"heat": h.number, "reason": reason}
+                    rejection = (reason, message, notice)
+                    print(message)
+                    self._notify("heat_rejected", {"iteration": iteration, **notice})
                     break
 
                 # check heat novice count constraints
@@ -92,29 +120,32 @@ class Randomizer(HeatGenerator):
                     skip_iteration = True
                     reason = "novice count out of bounds"
                     record_rejection_reason(reason)
-                    print(f"\n    Heat {h} rejected: {reason}")
-                    self._notify(
-                        "heat_rejected",
-                        {"iteration": iteration, "heat": h.number, "reason": reason},
-                    )
+                    message = f"\n    Heat {h} rejected: {reason}"
+                    notice = {"heat": h.number, "reason": reason}
+                    rejection = (reason, message, notice)
+                    print(message)
+                    self._notify("heat_rejected", {"iteration": iteration, **notice})
                     break
 
                 header = f"Heat {h} ({heat_size} total, {novice_count} novices)"
-                print(f"\n  {header}")
-                print(f"  {'-' * len(header)}\n")
-                print(f"    Car classes: {h.categories}\n")
+                print(
+                    f"\n  {header}\n  {'-' * len(header)}\n\n    Car classes: {h.categories}\n"
+                )
 
                 # check if number of qualified participants for each role exceed the minima required
+                # role minima and heat membership are fixed for this heat, so look them up once
                 complimentary_novice_count = len(
                     h.compliment.get_participants_by_attribute("novice")
                 )
-                role_extras = {}
-                for role, minimum in utils.roles_and_minima(
+                role_minima = utils.roles_and_minima(
                     number_of_stations=event.number_of_stations,
                     number_of_novices=complimentary_novice_count,
                     novice_denominator=event.novice_denominator,
-                ).items():
-                    qualified = len(h.get_participants_by_attribute(role))
+                )
+                heat_role_counts = [category_role_counts[c] for c in h.categories]
+                role_extras = {}
+                for role, minimum in role_minima.items():
+                    qualified = sum(counts[role] for counts in heat_role_counts)
                     role_extras[role] = (
                         qualified - minimum
                     )  # used later to assign workers to roles based on need
@@ -124,16 +155,15 @@ class Randomizer(HeatGenerator):
                         skip_iteration = True
                         reason = f"insufficient qualified {role}"
                         record_rejection_reason(reason)
-                        print(
-                            f"\n    Heat {h} rejected: unable to fill {role.upper()} role(s)"
-                        )
+                        message = f"\n    Heat {h} rejected: unable to fill {role.upper()} role(s)"
+                        notice = {
+                            "heat": h.number,
+                            "reason": f"unable to fill {role.upper()} role(s)",
+                        }
+                        rejection = (reason, message, notice)
+                        print(message)
                         self._notify(
-                            "heat_rejected",
-                            {
-                                "iteration": iteration,
-                                "heat": h.number,
-                                "reason": f"unable to fill {role.upper()} role(s)",
-                            },
+                            "heat_rejected", {"iteration": iteration, **notice}
                         )
                         break
 
@@ -145,11 +175,16 @@ class Randomizer(HeatGenerator):
                     # TODO: this is another thing that really needs to be split out
                     print()
 
+                    # group custom pre-assignments in one sweep; filling a role below never
+                    # hands out another role's assignment, so these groups stay accurate
+                    pre_assigned_by_role = {}
+                    for p in h.participants:
+                        if p.assignment:
+                            pre_assigned_by_role.setdefault(p.assignment, []).append(p)
+
                     # assign special assignments - redundant but is helpful for console output
                     # TODO: remove this sloppiness
-                    for p in h.get_participants_by_attribute(
-                        attribute="assignment", value="special"
-                    ):
+                    for p in pre_assigned_by_role.get("special", []):
                         p.set_assignment("special")
 
                     for role in utils.sort_dict_by_value(role_extras):
@@ -157,42 +192,41 @@ class Randomizer(HeatGenerator):
                             break
 
                         # calculate how many slots need to be filled for this role, accounting for custom pre-assignments
-                        pre_assigned_participants = h.get_participants_by_attribute(
-                            attribute="assignment", value=role
-                        )
+                        pre_assigned_participants = pre_assigned_by_role.get(role, [])
                         for p in pre_assigned_participants:
                             p.set_assignment(
                                 role
                             )  # redundant but is helpful for console output
                         pre_assigned_count = len(pre_assigned_participants)
-                        baseline_required_count = utils.roles_and_minima(
-                            number_of_stations=event.number_of_stations,
-                            number_of_novices=complimentary_novice_count,
-                            novice_denominator=event.novice_denominator,
-                        )[role]
+                        baseline_required_count = role_minima[role]
                         actual_required_count = (
                             baseline_required_count - pre_assigned_count
                         )
 
                         # fill the actual required slots for this role
-                        for _ in range(actual_required_count):
-                            available = h.get_available(role)
-                            if not available:
-                                rules_satisfied = False
-                                reason = f"unable to assign {role}"
-                                record_rejection_reason(reason)
-                                print(
-                                    f"\n  Heat {h} rejected: unable to fill {role} role(s)"
-                                )
-                                skip_iteration = True
-                                break
-                            else:
-                                available[0].set_assignment(role)
+                        # assigning only removes people from the pool, so one availability
+                        # scan per role picks the same participants as rescanning per slot
+                        available = h.get_available(role)
+                        for p in available[: max(actual_required_count, 0)]:
+                            p.set_assignment(role)
+                        if len(available) < actual_required_count:
+                            rules_satisfied = False
+                            reason = f"unable to assign {role}"
+                            record_rejection_reason(reason)
+                            message = (
+                                f"\n  Heat {h} rejected: unable to fill {role} role(s)"
+                            )
+                            rejection = (reason, message, None)
+                            print(message)
+                            skip_iteration = True
 
                     # now assign everyone else to worker role
                     for worker in h.get_available(role=None):
                         worker.set_assignment("worker")
 
+            if not rules_satisfied:
+                rejected_layouts[layout] = rejection
+
         if not rules_satisfied:
             self._print_rejection_summary(iteration + 1, rejection_reasons)
             print(
@@ -210,27 +244,78 @@ class Randomizer(HeatGenerator):
 
     def randomize_heats(self, event):
 
+        heats = event.heats
         categories = list(event.categories.values())
-        for c in categories:
-            c.set_heat(random.choice(event.heats))
+        choice = random.choice
 
         # hotfix: make CAM classes run together, if any exist
-        def cams_in_same_heat(categories):
-            cams = {cat for cat in categories if cat.name.startswith("CAM-")}
-            cam_heats = [c.heat.number for c in cams]
-            return len(set(cam_heats)) <= 1
+        cams = [c for c in categories if c.name.startswith("CAM-")]
+
+        # category sizes and heat size bounds are fixed while shuffling, so
+        # tally heat sizes from them instead of rebuilding heat.participants
+        category_sizes = [(c, len(c.participants)) for c in categories]
+        movable_category_sizes = [
+            (c, size) for c, size in category_sizes if c not in cams
+        ]
+        mean_heat_size = event.mean_heat_size
+        max_heat_size_delta = event.max_heat_size_delta
+
+        def assign_categories():
+            for c in categories:
+                c.set_heat(choice(heats))
+
+        def cams_in_same_heat():
+            return all(c.heat is cams[0].heat for c in cams)
+
+        def get_heat_sizes():
+            heat_sizes = dict.fromkeys(heats, 0)
+            for c, size in category_sizes:
+                heat_sizes[c.heat] += size
+            return heat_sizes
 
-        def valid_heat_sizes(heats):
-            return not any(not h.valid_size for h in heats)
+        def valid_heat_sizes(heat_sizes):
+            return all(
+                abs(mean_heat_size - heat_size) <= max_heat_size_delta
+                for heat_size in heat_sizes.values()
+            )
+
+        def repair_heat_sizes(heat_sizes):
+            """
+            Move random classes from the largest heat to the smallest one until heat sizes are valid.
+            Each move reduces the spread of heat sizes, so this always terminates.
+
+            Returns:
+                bool: True if heat sizes were brought within bounds, False if a full redraw is needed.
+            """
+            while not valid_heat_sizes(heat_sizes):
+                largest = max(heats, key=heat_sizes.__getitem__)
+                smallest = min(heats, key=heat_sizes.__getitem__)
+                gap = heat_sizes[largest] - heat_sizes[smallest]
+                movable = [
+                    (c, size)
+                    for c, size in movable_category_sizes
+                    if c.heat is largest and 0 < size < gap
+                ]
+                if not movable:
+                    return False
+                c, size = choice(movable)
+                c.set_heat(smallest)
+                heat_sizes[largest] -= size
+                heat_sizes[smallest] += size
+            return True
+
+        assign_categories()
 
         count = 0
-        while not (cams_in_same_heat(categories) and valid_heat_sizes(event.heats)):
-            for c in categories:
-                c.set_heat(random.choice(event.heats))
+        # keep a draw that is only slightly off by repairing it instead of starting over
+        while not (cams_in_same_heat() and repair_heat_sizes(get_heat_sizes())):
+            assign_categories()
             count += 1
             if count % 100 == 0:
                 self._notify("internal_iteration", {"iteration": count})
-            print(f"  Internal iteration: {count}", end="\r")
+                # the progress line is overwritten in place, so refresh it with the
+                # notification instead of writing to the console on every redraw
+                print(f"  Internal iteration: {count}", end="\r")
 
         print(f"  Internal iteration: {count}")
 
@@ -10,7 +10,9 @@ class Category(Group):
     Attributes:
         event (Event): The parent event object.
         name (str): The category name.
-        heat (int or None): Assigned heat number (if any).
+        heat (int or None): Assigned heat number (if any). Change it through `set_heat`;
+            heats cache their membership, and assigning `heat` directly leaves that
+            cache stale.
     """
 
     def __init__(self, event, name):
@@ -25,6 +27,8 @@ class Category(Group):
     def add_participant(self, participant: Participant):
         """Adds a participant to the category."""
         self.participants.append(participant)
+        # invalidate the heats' cached membership lists
+        self.event.layout_version = getattr(self.event, "layout_version", 0) + 1
 
     def set_heat(self, heat, verbose=False):
         """
@@ -35,6 +39,8 @@ class Category(Group):
         """
         previous_heat = self.heat
         self.heat = heat
+        # invalidate the heats' cached membership lists
+        self.event.layout_version = getattr(self.event, "layout_version", 0) + 1
 
         if verbose:
             print(
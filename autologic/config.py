@@ -1,7 +1,14 @@
+import errno
+import os
+import stat
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+# stat failures that Path.exists() reports as a missing path instead of raising
+MISSING_PATH_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+MISSING_PATH_WINERRORS = (21, 123, 1921)  # not ready, invalid name, unresolvable name
+
 
 class CustomAssignmentRecord(BaseModel):
     """Structured custom assignment configuration."""
@@ -49,9 +56,21 @@ class Config(BaseModel):
         """Ensure all paths exist and are files."""
         for path_attr in ["axware_export_tsv", "member_attributes_csv"]:
             path_value = getattr(self, path_attr)
-            if not path_value.exists():
+            # a single stat answers both existence and file-type checks
+            try:
+                path_stat = os.stat(path_value)
+            except ValueError:
+                path_stat = None
+            except OSError as exc:
+                if (
+                    exc.errno not in MISSING_PATH_ERRNOS
+                    and getattr(exc, "winerror", None) not in MISSING_PATH_WINERRORS
+                ):
+                    raise
+                path_stat = None
+            if path_stat is None:
                 raise FileNotFoundError(f"{path_attr} does not exist: {path_value}")
-            if not path_value.is_file():
+            if not stat.S_ISREG(path_stat.st_mode):
                 raise ValueError(f"{path_attr} is not a file: {path_value}")
 
 
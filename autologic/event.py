@@ -1,12 +1,13 @@
 import csv
 import math
 import pickle
+from collections import Counter
+from operator import itemgetter
 from autologic import utils
 from autologic.category import Category
 from autologic.group import Group
 from autologic.heat import Heat
 from autologic.participant import Participant
-from autologic.pdf import generate_event_pdf
 
 
 class Event(Group):
@@ -32,6 +33,8 @@ class Event(Group):
     ):
         self.name = name
         self.number_of_stations = number_of_stations
+        # bumped whenever heat membership changes; see Heat.participants
+        self.layout_version = 0
         self.participants = []
         (
             self.participants,
@@ -57,12 +60,9 @@ class Event(Group):
         self.mean_heat_size = round(len(self.participants) / number_of_heats)
         self.max_heat_size_delta = math.ceil(len(self.participants) / heat_size_parity)
 
-        self.mean_heat_novice_count = round(
-            len(self.get_participants_by_attribute("novice")) / number_of_heats
-        )
-        self.max_heat_novice_delta = math.ceil(
-            len(self.get_participants_by_attribute("novice")) / novice_size_parity
-        )
+        novice_count = len(self.get_participants_by_attribute("novice"))
+        self.mean_heat_novice_count = round(novice_count / number_of_heats)
+        self.max_heat_novice_delta = math.ceil(novice_count / novice_size_parity)
 
     def __repr__(self):
         return f"{self.name}"
@@ -206,7 +206,14 @@ class Event(Group):
         Returns:
             list[Heat]: Heat objects for this Event.
         """
-        return [Heat(self) for i in range(number_of_heats)]
+        return [Heat(self, number=i + 1) for i in range(number_of_heats)]
+
+    def renumber_heats(self):
+        """
+        Update heat numbers to match their order after `heats` is reordered in place.
+        """
+        for number, heat in enumerate(self.heats, start=1):
+            heat.number = number
 
     def get_heat(self, heat_number: int):
 
@@ -218,13 +225,23 @@ class Event(Group):
         print("\n  Role minimums")
         print("  -------------")
         insufficient = False
+
+        # tally novices and every role qualification in a single sweep of the participants
+        novice_count = 0
+        qualified_counts = dict.fromkeys(utils.roles_and_minima(), 0)
+        for p in self.participants:
+            if p.novice:
+                novice_count += 1
+            for role in qualified_counts:
+                if getattr(p, role, False):
+                    qualified_counts[role] += 1
+
         for role, minimum in utils.roles_and_minima(
             number_of_stations=self.number_of_stations,
-            number_of_novices=len(self.get_participants_by_attribute("novice"))
-            / self.number_of_heats,
+            number_of_novices=novice_count / self.number_of_heats,
             novice_denominator=self.novice_denominator,
         ).items():
-            qualified = len(self.get_participants_by_attribute(role))
+            qualified = qualified_counts[role]
             required = minimum * self.number_of_heats
             warning = (
                 " <-- NOT ENOUGH QUALIFIED WORKERS" if qualified < required else ""
@@ -253,22 +270,33 @@ class Event(Group):
             f"  Novice count must be {self.mean_heat_novice_count} +/- {self.max_heat_novice_delta}"
         )
 
+        # each heat's novice count feeds its own header and its compliment's instructor minimum
+        novice_counts = {
+            h: len(h.get_participants_by_attribute("novice")) for h in self.heats
+        }
+
         for h in self.heats:
 
-            header = f"Heat {h} ({len(h.participants)} total, {len(h.get_participants_by_attribute('novice'))} novices)"
-            print(f"\n  {header}")
-            print(f"  {'-' * len(header)}\n")
-            print(f"    Car classes: {h.categories}\n")
+            header = (
+                f"Heat {h} ({len(h.participants)} total, {novice_counts[h]} novices)"
+            )
+            # gather the heat's report and print it in one console write
+            lines = [
+                f"\n  {header}",
+                f"  {'-' * len(header)}\n",
+                f"    Car classes: {h.categories}\n",
+            ]
+            assignment_counts = Counter(p.assignment for p in h.participants)
 
             for role, minimum in utils.roles_and_minima(
                 number_of_stations=self.number_of_stations,
-                number_of_novices=len(
-                    h.compliment.get_participants_by_attribute("novice")
-                ),
+                number_of_novices=novice_counts[h.compliment],
                 novice_denominator=self.novice_denominator,
             ).items():
-                assigned = len(h.get_participants_by_attribute("assignment", role))
-                print(f"    {assigned} of {minimum} {role}s assigned")
+                lines.append(
+                    f"    {assignment_counts[role]} of {minimum} {role}s assigned"
+                )
+            print("\n".join(lines))
 
         print(f"\n  Summary\n  -------\n")
         for h in self.heats:
@@ -410,22 +438,21 @@ class Event(Group):
         """
 
         with open(f"{self.name}.csv", "w", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "heat",
-                    "name",
-                    "class",
-                    "number",
-                    "assignment",
-                    "checked_in",
-                ],
+            # rows are pulled into field order directly; DictWriter re-validates every key
+            writer = csv.writer(f)
+            writer.writerow(utils.WORK_ASSIGNMENT_FIELDS)
+            writer.writerows(
+                map(
+                    itemgetter(*utils.WORK_ASSIGNMENT_FIELDS),
+                    self.get_work_assignments(),
+                )
             )
-            writer.writeheader()
-            writer.writerows(self.get_work_assignments())
             print(f"\n  Worker assignment sheet saved to {self.name}.csv")
 
     def to_pdf(self):
         """Generate the worker/grid tracking PDF."""
 
+        # reportlab is slow to import, so only load it when a PDF is requested
+        from autologic.pdf import generate_event_pdf
+
         generate_event_pdf(self)
@@ -27,12 +27,15 @@
 # support classes and entrypoint
 # -------------------------------------------------------------------------------------------------
 
+import copy
 import csv
+import functools
 import os
 import pickle
 import queue
 import sys
 import threading
+from collections import deque
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -47,10 +50,19 @@ from autologic.app import load_event, main
 from autologic.config import Config, resolve_config_paths
 from autologic.event import Event
 
+# prefer the libyaml bindings when pyyaml was built with them
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+
 # constants and defaults -------------------------------------------------------------------
 # centralizes user interface labels, colors, and default values for consistent configuration
 ASSIGNMENT_OPTIONS = ["instructor", "timing", "grid", "start", "captain", "special"]
 ROLE_OPTIONS = ASSIGNMENT_OPTIONS + ["worker"]
+# treeview tags for assignment rows, indexed by the row's use flag
+ASSIGNMENT_ROW_TAGS = (("disabled",), ())
 SUMMARY_COLUMNS = [
     "Group",
     "Instructor",
@@ -126,6 +138,7 @@ class AutologicGUI:
         self.assignment_editor: ttk.Combobox | None = None
         self.assignment_context_menu: tk.Menu | None = None
         self.parameter_tooltips: list["HoverTooltip"] = []
+        self.summary_cell_labels: list[list[ttk.Label]] = []
 
         is_frozen = getattr(sys, "frozen", False)
         # resolve base directories differently for bundled executables
@@ -301,6 +314,11 @@ class AutologicGUI:
 
         self.checkbox_unchecked_image = self._create_checkbox_image(checked=False)
         self.checkbox_checked_image = self._create_checkbox_image(checked=True)
+        # indexed by an assignment row's use flag
+        self.checkbox_images = (
+            self.checkbox_unchecked_image,
+            self.checkbox_checked_image,
+        )
 
         self._build_layout()
         self._register_variable_traces()
@@ -1060,8 +1078,13 @@ class AutologicGUI:
             config_path: Path to the config file to load.
         """
         try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                config_data = yaml.safe_load(file) or {}
+            config_stat = os.stat(config_path)
+            # copy the cached parse so edits in the user interface never leak into it
+            config_data = copy.deepcopy(
+                _parse_config_file(
+                    str(config_path), config_stat.st_mtime_ns, config_stat.st_size
+                )
+            )
             # resolve file paths relative to the config file location
             config_data = resolve_config_paths(config_data, config_path)
         except Exception as exc:
@@ -1113,8 +1136,7 @@ class AutologicGUI:
                 self.algorithm_variable.set(str(config_data["algorithm"]))
 
             # rebuild the assignments table so it matches config order and state
-            for item in self.assignments_tree.get_children():
-                self.assignments_tree.delete(item)
+            self.assignments_tree.delete(*self.assignments_tree.get_children())
             self.assignment_use_state.clear()
 
             custom_assignments = config_data.get("custom_assignments", {}) or {}
@@ -1122,11 +1144,13 @@ class AutologicGUI:
                 assignment_value, use_flag = self._parse_assignment_record(assignment)
                 if not assignment_value:
                     continue
+                # the add row is placed once after the bulk insert below
                 self._insert_assignment_row(
                     use_flag,
                     str(member_id),
                     self.member_name_lookup.get(str(member_id), ""),
                     assignment_value,
+                    ensure_add_row=False,
                 )
 
             self._refresh_assignment_names()
@@ -1137,21 +1161,25 @@ class AutologicGUI:
         # update dependent data after config values are set
         self._load_member_names()
 
-    def _save_config(self) -> bool:
+    def _save_config(self, config_data: dict | None = None) -> bool:
         """Persist the current GUI configuration to the active YAML file.
 
+        Args:
+            config_data: Prebuilt config payload; built from the widgets when omitted.
+
         Returns:
             bool: True if saved successfully, False otherwise.
         """
-        try:
-            config_data = self._build_config_payload()
-        except ValueError as exc:
-            messagebox.showerror("Error", f"Invalid configuration: {exc}")
-            return False
+        if config_data is None:
+            try:
+                config_data = self._build_config_payload()
+            except ValueError as exc:
+                messagebox.showerror("Error", f"Invalid configuration: {exc}")
+                return False
 
         try:
             with open(self.config_path, "w", encoding="utf-8") as file:
-                yaml.safe_dump(config_data, file, sort_keys=False)
+                yaml.dump(config_data, file, Dumper=YamlDumper, sort_keys=False)
         except OSError as exc:
             messagebox.showerror("Error", f"Failed to save config: {exc}")
             return False
@@ -1181,13 +1209,17 @@ class AutologicGUI:
             "algorithm": self.algorithm_variable.get().strip(),
         }
 
-    def _build_config_snapshot(self) -> dict:
+    def _build_config_snapshot(self, config_data: dict | None = None) -> dict:
         """Build a config snapshot for event persistence.
 
+        Args:
+            config_data: Prebuilt config payload; built from the widgets when omitted.
+
         Returns:
             dict: Configuration snapshot with resolved data paths.
         """
-        config_data = self._build_config_payload()
+        if config_data is None:
+            config_data = self._build_config_payload()
         # store absolute data paths so pickle reloads do not depend on the config file
         return resolve_config_paths(config_data, self.config_path)
 
@@ -1205,7 +1237,7 @@ class AutologicGUI:
     def _start_generation(self) -> None:
         """Start event generation in a background thread."""
         config_data = self._build_config_payload()
-        algorithm = config_data.get("algorithm", self.algorithm_variable.get())
+        algorithm = config_data["algorithm"]
         resolved_config_data = resolve_config_paths(config_data, self.config_path)
         resolved_config_data.pop("algorithm", None)
 
@@ -1228,7 +1260,8 @@ class AutologicGUI:
                 break
 
         # run generation in a thread to keep the GUI responsive
-        config_payload = config.model_dump()
+        # a shallow field mapping is enough for load_event, so skip model_dump's deep copy
+        config_payload = dict(config)
         self.generation_thread = threading.Thread(
             target=self._run_generation_thread,
             args=(config_payload, algorithm),
@@ -1346,11 +1379,15 @@ class AutologicGUI:
             return config_snapshot
         return None
 
-    def _set_event_config_snapshot(self) -> None:
-        """Attach the current config snapshot to the active event."""
+    def _set_event_config_snapshot(self, config_data: dict | None = None) -> None:
+        """Attach the current config snapshot to the active event.
+
+        Args:
+            config_data: Prebuilt config payload; built from the widgets when omitted.
+        """
         if not self.current_event:
             return
-        config_snapshot = self._build_config_snapshot()
+        config_snapshot = self._build_config_snapshot(config_data)
         # store config alongside the event so reloads can restore GUI inputs
         self.current_event.config_snapshot = config_snapshot
 
@@ -1390,9 +1427,15 @@ class AutologicGUI:
         self.current_event.name = event_name
         self.event_name_variable.set(event_name)
 
-        if not self._save_config():
+        # read the widgets once and share the payload between the config file and snapshot
+        try:
+            config_data = self._build_config_payload()
+        except ValueError as exc:
+            messagebox.showerror("Error", f"Invalid configuration: {exc}")
             return
-        self._set_event_config_snapshot()
+        if not self._save_config(config_data):
+            return
+        self._set_event_config_snapshot(config_data)
 
         # change into the output directory for the export helpers
         previous_dir = Path.cwd()
@@ -1486,10 +1529,8 @@ class AutologicGUI:
 
     def _refresh_summary_table(self) -> None:
         """Render the role summary table and validation status."""
-        for child in self.summary_table_container.winfo_children():
-            child.destroy()
-
         if not self.current_event:
+            self._clear_summary_table()
             ttk.Label(
                 self.summary_table_container,
                 text="No event loaded",
@@ -1503,6 +1544,7 @@ class AutologicGUI:
         validation_state = self._evaluate_event_validity()
         event_is_valid = validation_state["event_is_valid"]
         invalid_cells = validation_state["invalid_cells"]
+        heat_summaries = validation_state["heat_summaries"]
         if event_is_valid:
             self.validation_status_variable.set("Validation: OK")
             self.validation_status_label.configure(style="Validation.Ok.TLabel")
@@ -1510,21 +1552,13 @@ class AutologicGUI:
             self.validation_status_variable.set("Validation: INVALID")
             self.validation_status_label.configure(style="Validation.Invalid.TLabel")
 
-        for column_index, column_name in enumerate(SUMMARY_COLUMNS):
-            header = ttk.Label(
-                self.summary_table_container,
-                text=column_name,
-                style="Summary.Header.TLabel",
-                anchor="center",
-                padding=(4, 2),
-            )
-            header.grid(row=0, column=column_index, sticky="nsew", padx=1, pady=1)
-            self.summary_table_container.grid_columnconfigure(column_index, weight=1)
+        # reuse the existing cell labels unless the number of heats changed
+        if len(self.summary_cell_labels) != len(self.current_event.heats):
+            self._build_summary_grid(len(self.current_event.heats))
 
         # populate rows per heat to align with PDF output ordering
         for heat_index, heat in enumerate(self.current_event.heats, start=1):
-            counts = self._count_assignments(heat)
-            novices = len(heat.get_participants_by_attribute("novice"))
+            counts, novices, heat_size = heat_summaries[heat]
             row_values = [
                 str(heat_index),
                 str(counts["instructor"]),
@@ -1534,21 +1568,51 @@ class AutologicGUI:
                 str(counts["captain"]),
                 str(counts["worker"]),
                 str(counts["special"]),
-                f"{str(len(heat.participants))} ({novices} Novices)",
+                f"{heat_size} ({novices} Novices)",
             ]
 
+            invalid_columns = invalid_cells.get(heat.number, set())
+            row_labels = self.summary_cell_labels[heat_index - 1]
             for column_index, column_name in enumerate(SUMMARY_COLUMNS):
-                is_invalid = False
-                if column_name in invalid_cells.get(heat.number, set()):
-                    is_invalid = True
-
                 style_name = (
-                    "Summary.Invalid.TLabel" if is_invalid else "Summary.Valid.TLabel"
+                    "Summary.Invalid.TLabel"
+                    if column_name in invalid_columns
+                    else "Summary.Valid.TLabel"
                 )
+                row_labels[column_index].configure(
+                    text=row_values[column_index], style=style_name
+                )
+
+    def _clear_summary_table(self) -> None:
+        """Destroy all widgets in the role summary table."""
+        for child in self.summary_table_container.winfo_children():
+            child.destroy()
+        self.summary_cell_labels = []
+
+    def _build_summary_grid(self, heat_count: int) -> None:
+        """Create the header and empty cell labels for the role summary table.
+
+        Args:
+            heat_count: Number of heat rows to create.
+        """
+        self._clear_summary_table()
+        for column_index, column_name in enumerate(SUMMARY_COLUMNS):
+            header = ttk.Label(
+                self.summary_table_container,
+                text=column_name,
+                style="Summary.Header.TLabel",
+                anchor="center",
+                padding=(4, 2),
+            )
+            header.grid(row=0, column=column_index, sticky="nsew", padx=1, pady=1)
+            self.summary_table_container.grid_columnconfigure(column_index, weight=1)
+
+        for heat_index in range(1, heat_count + 1):
+            row_labels = []
+            for column_index in range(len(SUMMARY_COLUMNS)):
                 cell = ttk.Label(
                     self.summary_table_container,
-                    text=row_values[column_index],
-                    style=style_name,
+                    style="Summary.Valid.TLabel",
                     anchor="center",
                     padding=(4, 2),
                 )
@@ -1559,6 +1623,8 @@ class AutologicGUI:
                     padx=1,
                     pady=1,
                 )
+                row_labels.append(cell)
+            self.summary_cell_labels.append(row_labels)
 
     # validation helpers ----------------------------------------------------------------------
     # computes role counts and validity to drive summary highlighting
@@ -1566,20 +1632,22 @@ class AutologicGUI:
         """Evaluate event validity and capture which summary cells are invalid.
 
         Returns:
-            dict: Validation results and invalid cell locations.
+            dict: Validation results, invalid cell locations, and per-heat summaries.
         """
         invalid_cells: dict[int, set[str]] = {}
         event_is_valid = True
+        # tally every heat once; compliment novice counts reuse the same tallies
+        heat_summaries = {
+            heat: self._summarize_heat(heat) for heat in self.current_event.heats
+        }
 
         for heat in self.current_event.heats:
             invalid_columns: set[str] = set()
-            counts = self._count_assignments(heat)
+            counts, novice_count, heat_size = heat_summaries[heat]
 
             role_minima = utils.roles_and_minima(
                 number_of_stations=self.current_event.number_of_stations,
-                number_of_novices=len(
-                    heat.compliment.get_participants_by_attribute("novice")
-                ),
+                number_of_novices=heat_summaries[heat.compliment][1],
                 novice_denominator=self.current_event.novice_denominator,
             )
 
@@ -1595,8 +1663,6 @@ class AutologicGUI:
                         invalid_columns.add(role.capitalize())
                         event_is_valid = False
 
-            heat_size = len(heat.participants)
-            novice_count = len(heat.get_participants_by_attribute("novice"))
             valid_size = (
                 abs(self.current_event.mean_heat_size - heat_size)
                 <= self.current_event.max_heat_size_delta
@@ -1611,7 +1677,11 @@ class AutologicGUI:
 
             invalid_cells[heat.number] = invalid_columns
 
-        return {"event_is_valid": event_is_valid, "invalid_cells": invalid_cells}
+        return {
+            "event_is_valid": event_is_valid,
+            "invalid_cells": invalid_cells,
+            "heat_summaries": heat_summaries,
+        }
 
     def _count_assignments(self, heat) -> dict[str, int]:
         """Count role assignments for a heat.
@@ -1622,6 +1692,18 @@ class AutologicGUI:
         Returns:
             dict[str, int]: Assignment counts for the heat.
         """
+        return self._summarize_heat(heat)[0]
+
+    def _summarize_heat(self, heat) -> tuple[dict[str, int], int, int]:
+        """Count role assignments, novices, and participants for a heat in one pass.
+
+        Args:
+            heat: Heat to summarize.
+
+        Returns:
+            tuple[dict[str, int], int, int]: Assignment counts, novice count, and
+                participant count for the heat.
+        """
         counts = {
             "instructor": 0,
             "timing": 0,
@@ -1631,11 +1713,15 @@ class AutologicGUI:
             "worker": 0,
             "special": 0,
         }
-        for participant in heat.participants:
+        novice_count = 0
+        participants = heat.participants
+        for participant in participants:
             assignment = participant.assignment or ""
             if assignment in counts:
                 counts[assignment] += 1
-        return counts
+            if participant.novice:
+                novice_count += 1
+        return counts, novice_count, len(participants)
 
     def _validate_current_event(self) -> None:
         """Validate the current event and update status."""
@@ -1862,9 +1948,10 @@ class AutologicGUI:
 
         offset = 1 % self.current_event.number_of_heats
         # rotate in place to preserve list references held elsewhere
-        self.current_event.heats[:] = (
-            self.current_event.heats[-offset:] + self.current_event.heats[:-offset]
-        )
+        rotated_heats = deque(self.current_event.heats)
+        rotated_heats.rotate(offset)
+        self.current_event.heats[:] = rotated_heats
+        self.current_event.renumber_heats()
         self._mark_event_dirty()
         self._refresh_event_views()
         self._validate_current_event()
@@ -2124,7 +2211,12 @@ class AutologicGUI:
         self._ensure_add_assignment_row()
 
     def _insert_assignment_row(
-        self, use_flag: bool, member_id: str, name: str, assignment: str
+        self,
+        use_flag: bool,
+        member_id: str,
+        name: str,
+        assignment: str,
+        ensure_add_row: bool = True,
     ) -> None:
         """Insert a custom assignment row into the table.
 
@@ -2133,6 +2225,7 @@ class AutologicGUI:
             member_id: Member identifier.
             name: Display name.
             assignment: Assigned role.
+            ensure_add_row: Whether to move the add-assignment row back to the end.
         """
         member_id = str(member_id).strip()
         name = str(name).strip()
@@ -2140,16 +2233,13 @@ class AutologicGUI:
         item_id = self.assignments_tree.insert(
             "",
             END,
-            image=(
-                self.checkbox_checked_image
-                if use_flag
-                else self.checkbox_unchecked_image
-            ),
+            image=self.checkbox_images[bool(use_flag)],
             values=(member_id, name, assignment),
+            tags=ASSIGNMENT_ROW_TAGS[bool(use_flag)],
         )
         self.assignment_use_state[item_id] = use_flag
-        self._refresh_assignment_styles()
-        self._ensure_add_assignment_row()
+        if ensure_add_row:
+            self._ensure_add_assignment_row()
 
     def _ensure_add_assignment_row(self) -> None:
         """Ensure the add-assignment row is the last row."""
@@ -2301,7 +2391,8 @@ class AutologicGUI:
         """
         use_flag = self.assignment_use_state.get(item_id, True)
         self.assignment_use_state[item_id] = not use_flag
-        self._refresh_assignment_styles()
+        # only the clicked row changes, so restyle just that row
+        self._refresh_assignment_style(item_id)
         self._mark_config_dirty()
 
     def _refresh_assignment_styles(self) -> None:
@@ -2309,17 +2400,20 @@ class AutologicGUI:
         for item in self.assignments_tree.get_children():
             if self._is_add_assignment_row(item):
                 continue
-            use_flag = self.assignment_use_state.get(item, True)
-            tag = "disabled" if not use_flag else ""
-            self.assignments_tree.item(
-                item,
-                image=(
-                    self.checkbox_checked_image
-                    if use_flag
-                    else self.checkbox_unchecked_image
-                ),
-            )
-            self.assignments_tree.item(item, tags=(tag,))
+            self._refresh_assignment_style(item)
+
+    def _refresh_assignment_style(self, item_id: str) -> None:
+        """Refresh checkbox and text styles for a single assignment row.
+
+        Args:
+            item_id: Treeview item identifier.
+        """
+        use_flag = self.assignment_use_state.get(item_id, True)
+        self.assignments_tree.item(
+            item_id,
+            image=self.checkbox_images[bool(use_flag)],
+            tags=ASSIGNMENT_ROW_TAGS[bool(use_flag)],
+        )
 
     def _parse_assignment_record(self, assignment_value: object) -> tuple[str, bool]:
         """Normalize assignment config entries into values the GUI can use.
@@ -2636,10 +2730,12 @@ class GenerationCancelled(Exception):
 
 class EventUnpickler(pickle.Unpickler):
     """
-    Unpickler with legacy module name support.
+    Unpickler restricted to Autologic event objects.
 
-    Helps with loading old events from the beta version of this program.
-    This will be removed in the future.
+    Only the Autologic domain classes and plain builtin containers may be loaded,
+    so a tampered event file cannot run arbitrary code. Legacy module names from
+    the beta version of this program are still mapped; that support will be
+    removed in the future.
     """
 
     MODULE_ALIASES = {
@@ -2663,15 +2759,31 @@ class EventUnpickler(pickle.Unpickler):
         "Group": "autologic.group",
     }
 
+    # event files only ever reference the domain classes and a few plain containers
+    ALLOWED_GLOBALS = {
+        *((module, name) for name, module in CLASS_MODULES.items()),
+        ("builtins", "dict"),
+        ("builtins", "frozenset"),
+        ("builtins", "list"),
+        ("builtins", "set"),
+        ("builtins", "tuple"),
+    }
+
     def find_class(self, module: str, name: str):
         """Resolve legacy module names while unpickling events.
 
+        Only the Autologic domain classes and plain builtin containers may be
+        loaded, so a tampered event file cannot import arbitrary callables.
+
         Args:
             module: Module name recorded in the pickle.
             name: Class name recorded in the pickle.
 
         Returns:
             type: Resolved class object.
+
+        Raises:
+            pickle.UnpicklingError: If the pickle references any other global.
         """
         # map legacy module paths so older pickles still load cleanly
         module_alias = self.MODULE_ALIASES.get(module)
@@ -2679,8 +2791,31 @@ class EventUnpickler(pickle.Unpickler):
             module = module_alias
         elif module == "__main__" and name in self.CLASS_MODULES:
             module = self.CLASS_MODULES[name]
+        if (module, name) not in self.ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(
+                f"Unsupported object in event file: {module}.{name}"
+            )
         return super().find_class(module, name)
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(config_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML config file, memoized on its path and stat signature.
+
+    The modification time and size are part of the cache key so edits on disk
+    invalidate the cached entry automatically.
+
+    Args:
+        config_path: Path to the config file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        dict: Parsed configuration data.
+    """
+    # hand raw bytes to the parser so it skips the text-mode decode wrapper
+    return yaml.load(Path(config_path).read_bytes(), Loader=YamlLoader) or {}
+
+
 if __name__ == "__main__":
     AutologicGUI().run()
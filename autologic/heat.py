@@ -1,3 +1,4 @@
+from collections import Counter
 from autologic import utils
 from autologic.group import Group
 
@@ -8,12 +9,16 @@ class Heat(Group):
 
     Attributes:
         event (Event): The parent event.
-        number (int): Heat identifier.
+        number (int): Heat identifier; the heat's 1-based position in `event.heats`.
     """
 
-    def __init__(self, event):
+    def __init__(self, event, number=None):
         self.event = event
+        self.number = number
         self.assigned_categories = []
+        self._membership_version = None
+        self._categories = []
+        self._participants = []
 
     def __repr__(self):
         return f"{self.number}"
@@ -21,7 +26,14 @@ class Heat(Group):
     @property
     def number(self):
 
-        return self.event.heats.index(self) + 1
+        # events pickled before heats stored their number fall back to a list scan
+        number = getattr(self, "_number", None)
+        return number if number is not None else self.event.heats.index(self) + 1
+
+    @number.setter
+    def number(self, number):
+
+        self._number = number
 
     @property
     def categories(self):
@@ -31,9 +43,8 @@ class Heat(Group):
         Returns:
             list[Category]: Matching categories from the event.
         """
-        return [
-            c for c in self.event.categories.values() if c.heat.number == self.number
-        ]
+        self._refresh_membership()
+        return self._categories
 
     @property
     def participants(self):
@@ -43,7 +54,26 @@ class Heat(Group):
         Returns:
             list[Participant]: All participants in this heat.
         """
-        return sum([c.participants for c in self.categories], [])
+        self._refresh_membership()
+        return self._participants
+
+    def _refresh_membership(self):
+        """
+        Rebuild the cached category and participant lists if heat membership has changed.
+
+        Category.set_heat and Category.add_participant bump the event's layout version, so
+        the lists are only rebuilt after a change instead of on every access. Events pickled
+        before the version existed are rebuilt on every access until their first change.
+        """
+        version = getattr(self.event, "layout_version", None)
+        if version is not None and version == getattr(
+            self, "_membership_version", None
+        ):
+            return
+
+        self._categories = [c for c in self.event.categories.values() if c.heat is self]
+        self._participants = [p for c in self._categories for p in c.participants]
+        self._membership_version = version
 
     @property
     def valid_size(self):
@@ -77,7 +107,9 @@ class Heat(Group):
     @property
     def valid_role_fulfillment(self):
 
-        is_valid = True
+        # collect violations and print them together so the heat costs one console write
+        violations = []
+        assignment_counts = Counter(p.assignment for p in self.participants)
 
         for role, minimum in utils.roles_and_minima(
             number_of_stations=self.event.number_of_stations,
@@ -89,27 +121,31 @@ class Heat(Group):
 
             # exact matches are specified to ensure enough course workers
             # with the exception of instructors, who may exceed the minimum
-            fulfilled = len(self.get_participants_by_attribute("assignment", role))
+            fulfilled = assignment_counts[role]
             if (
                 fulfilled != minimum and not role == "instructor"
             ) or fulfilled < minimum:
-                print(
+                violations.append(
                     f"    Heat {self} violation: {fulfilled} assignments for {role} ({minimum} expected)"
                 )
-                is_valid = False
 
-        for p in self.participants:
+        # the accepted assignments are the same for every participant, so build them once;
+        # the list keeps the order used in the violation message
+        valid_roles = list(utils.roles_and_minima().keys())
+        valid_roles += ["worker", "special"]
+        valid_role_set = set(valid_roles)
 
-            valid_roles = list(utils.roles_and_minima().keys())
-            valid_roles += ["worker", "special"]
+        for p in self.participants:
 
-            if not p.assignment in valid_roles:
-                print(
+            if not p.assignment in valid_role_set:
+                violations.append(
                     f"    Heat {self} violation: {p} assignment of {p.assignment} is not not valid (one of {valid_roles} expected)"
                 )
-                is_valid = False
 
-        return is_valid
+        if violations:
+            print("\n".join(violations))
+
+        return not violations
 
     @property
     def running(self):
@@ -129,8 +165,10 @@ class Heat(Group):
     @property
     def compliment(self):
         # heat that is running while self is working
-        for h in self.event.heats:
-            if h.running == self.working:
-                return h
+        # heats run in list order, so the heat running in slot N is heats[N - 1]
+        working = self.working
+        heats = self.event.heats
+        if 1 <= working <= len(heats):
+            return heats[working - 1]
 
         raise ValueError(f"Heat {self} has no compliment")
@@ -1,4 +1,3 @@
-import questionary
 import sys
 from autologic import utils
 
@@ -88,6 +87,9 @@ class Participant:
         """
 
         if not self.event:
+            # questionary pulls in prompt_toolkit, so only load it for this prompt
+            import questionary
+
             choice = questionary.select(
                 f"\nWARNING: {self} has custom assignment {assignment.upper()} but has not checked in:",
                 choices=[f"Continue without {self}", "Quit"],
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from operator import itemgetter
+
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import letter
@@ -15,12 +18,85 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from autologic import utils
+
 FONT_NAME = "Courier"
 FONT_NAME_BOLD = "Courier-Bold"
 FONT_SIZE = 9
 CELL_PADDING = 12
 # reportlab table sizing is based on absolute widths; keep these constants together for consistency
 
+# reportlab re-lays out the remainder of a table on every page split, so long tables
+# are emitted as independent chunks of at most this many body rows
+TABLE_CHUNK_ROWS = 250
+
+# every printable ASCII glyph in the standard Courier faces advances 600/1000 em, so
+# those cells can be measured by character count instead of per-glyph metric lookups
+MONOSPACE_FONTS = frozenset(
+    {"Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique"}
+)
+MONOSPACE_GLYPH_WIDTH = 600
+
+# worker and grid table layouts: event row keys, display headers, and left-aligned columns;
+# worker rows use utils.WORK_ASSIGNMENT_FIELDS, shared with the CSV export
+WORKER_DISPLAY_HEADERS = (
+    "Working",
+    "Name",
+    "Class",
+    "Number",
+    "Assignment",
+    "Checked In",
+)
+WORKER_NAME_IDX = utils.WORK_ASSIGNMENT_FIELDS.index("name")
+WORKER_ASSIGNMENT_IDX = utils.WORK_ASSIGNMENT_FIELDS.index("assignment")
+GRID_WORKER_HEADERS = ("heat", "name", "class", "number", "tally")
+GRID_WORKER_DISPLAY_HEADERS = ("Running", "Name", "Class", "Number", "Run Tally")
+GRID_WORKER_NAME_IDX = GRID_WORKER_HEADERS.index("name")
+
+# summary table layout; the role order matches the GUI summary
+SUMMARY_ROLES = (
+    "instructor",
+    "timing",
+    "grid",
+    "start",
+    "captain",
+    "worker",
+    "special",
+)
+SUMMARY_ROLE_IDS = {role: role_id for role_id, role in enumerate(SUMMARY_ROLES)}
+SUMMARY_HEADERS = (
+    "Group",
+    "Instructor",
+    "Timing",
+    "Grid",
+    "Start",
+    "Captain",
+    "Worker",
+    "Special",
+    "Total",
+)
+
+# data-independent style commands shared by the worker, grid, and summary tables
+BASE_TABLE_STYLE = (
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("FONTNAME", (0, 0), (-1, 0), FONT_NAME_BOLD),
+    ("FONTNAME", (0, 1), (-1, -1), FONT_NAME),
+    ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
+)
+HEAT_CLASS_TABLE_STYLE = (
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("ALIGN", (0, 0), (0, -1), "LEFT"),
+    ("ALIGN", (1, 0), (1, -1), "LEFT"),
+    ("VALIGN", (0, 1), (-1, -1), "TOP"),
+    ("FONTNAME", (0, 0), (-1, 0), FONT_NAME_BOLD),
+    ("FONTNAME", (0, 1), (-1, -1), FONT_NAME),
+    ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
+)
+
 
 def generate_event_pdf(event, output_path=None):
     """
@@ -46,11 +122,19 @@ def generate_event_pdf(event, output_path=None):
         alignment=TA_CENTER,
     )
 
+    # gather event rows once up front so each table builder only handles layout
+    work_assignments = event.get_work_assignments()
+    heat_assignments = event.get_heat_assignments()
+    run_assignments = sorted(
+        event.get_run_assignments(),
+        key=itemgetter("heat", "class", "number"),
+    )
+
     # each section/table is built separately to keep layout concerns isolated
-    worker_table = _build_worker_table(event, available_width)
-    heat_class_table = _build_heat_class_table(event, available_width)
+    worker_tables = _build_worker_tables(work_assignments, available_width)
+    heat_class_table = _build_heat_class_table(heat_assignments, available_width)
     summary_table = _build_summary_table(event, available_width)
-    grid_worker_table = _build_grid_worker_table(event, available_width)
+    grid_worker_tables = _build_grid_worker_tables(run_assignments, available_width)
 
     elements = [
         Paragraph(f"{event.name}", styles["Title"]),
@@ -59,10 +143,10 @@ def generate_event_pdf(event, output_path=None):
         summary_table,
         Spacer(1, 6),
         Paragraph("Worker Tracking", heading_style),
-        worker_table,
+        *worker_tables,
         PageBreak(),
         Paragraph("Grid Tracking", heading_style),
-        grid_worker_table,
+        *grid_worker_tables,
     ]
 
     # custom canvas prints "Page X of Y" in the footer
@@ -71,52 +155,38 @@ def generate_event_pdf(event, output_path=None):
     return pdf_path
 
 
-def _build_worker_table(event, available_width):
-    """Build the worker assignment table (working group, name, class, number, assignment)."""
+def _build_worker_tables(work_assignments, available_width):
+    """Build the worker assignment table (working group, name, class, number, assignment).
 
-    headers = ["heat", "name", "class", "number", "assignment", "checked_in"]
-    display_headers = [
-        "Working",
-        "Name",
-        "Class",
-        "Number",
-        "Assignment",
-        "Checked In",
-    ]
-    table_data = [display_headers] + [
-        [str(row[h]).upper() for h in headers] for row in event.get_work_assignments()
-    ]
+    Returns:
+        list[Table]: The table, split into chunks when it is long.
+    """
 
-    col_widths = _compute_scaled_col_widths(
-        data=table_data,
+    table_data, max_widths = _build_rows_and_widths(
+        rows=work_assignments,
+        headers=utils.WORK_ASSIGNMENT_FIELDS,
+        display_headers=WORKER_DISPLAY_HEADERS,
         font_name=FONT_NAME,
         font_size=FONT_SIZE,
-        padding=CELL_PADDING,
-        total_width=available_width,
     )
-    table = Table(table_data, colWidths=col_widths, repeatRows=1)
-    name_idx = headers.index("name")
-    assignment_idx = headers.index("assignment")
+    col_widths = _scale_widths(max_widths, CELL_PADDING, available_width)
 
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("ALIGN", (name_idx, 1), (name_idx, -1), "LEFT"),
-                ("ALIGN", (assignment_idx, 1), (assignment_idx, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), FONT_NAME_BOLD),
-                ("FONTNAME", (0, 1), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
-            ]
-        )
+    style = TableStyle(
+        [
+            *BASE_TABLE_STYLE,
+            ("ALIGN", (WORKER_NAME_IDX, 1), (WORKER_NAME_IDX, -1), "LEFT"),
+            (
+                "ALIGN",
+                (WORKER_ASSIGNMENT_IDX, 1),
+                (WORKER_ASSIGNMENT_IDX, -1),
+                "LEFT",
+            ),
+        ]
     )
-    return table
+    return _build_chunked_tables(table_data, col_widths, style)
 
 
-def _build_heat_class_table(event, available_width):
+def _build_heat_class_table(heat_assignments, available_width):
     """Build the heat/class summary table (run/work pairing + class list per heat)."""
 
     styles = getSampleStyleSheet()
@@ -129,13 +199,14 @@ def _build_heat_class_table(event, available_width):
     )
 
     heat_class_rows = [["Heat", "Classes"]]
-    for run_work, classes in event.get_heat_assignments():
+    for run_work, classes in heat_assignments:
         safe_classes = escape(str(classes))
         heat_class_rows.append([run_work, Paragraph(safe_classes, class_style)])
 
     # keep the run/work column compact to maximize class wrap width
     max_heat_label_width = max(
-        stringWidth(str(row[0]), FONT_NAME, FONT_SIZE) for row in heat_class_rows
+        _cached_string_width(str(row[0]), FONT_NAME, FONT_SIZE)
+        for row in heat_class_rows
     )
     heat_col_width = min(
         max_heat_label_width + CELL_PADDING,
@@ -144,67 +215,32 @@ def _build_heat_class_table(event, available_width):
     class_col_width = available_width - heat_col_width
     col_widths = [heat_col_width, class_col_width]
     heat_class_table = Table(heat_class_rows, colWidths=col_widths, repeatRows=1)
-    heat_class_table.setStyle(
-        TableStyle(
-            [
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                ("ALIGN", (1, 0), (1, -1), "LEFT"),
-                ("VALIGN", (0, 1), (-1, -1), "TOP"),
-                ("FONTNAME", (0, 0), (-1, 0), FONT_NAME_BOLD),
-                ("FONTNAME", (0, 1), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
-            ]
-        )
-    )
+    heat_class_table.setStyle(TableStyle(HEAT_CLASS_TABLE_STYLE))
     return heat_class_table
 
 
 def _build_summary_table(event, available_width):
     """Build the per-heat role fulfillment summary table (counts by role + total/novices)."""
 
-    roles = [
-        "instructor",
-        "timing",
-        "grid",
-        "start",
-        "captain",
-        "worker",
-        "special",
-    ]
-    summary_data = [
-        [
-            "Group",
-            "Instructor",
-            "Timing",
-            "Grid",
-            "Start",
-            "Captain",
-            "Worker",
-            "Special",
-            "Total",
-        ]
-    ]
+    summary_data = [list(SUMMARY_HEADERS)]
 
     for idx, heat in enumerate(event.heats, start=1):
-        novices = sum(1 for participant in heat.participants if participant.novice)
-        counts = {role: 0 for role in roles}
-        for participant in heat.participants:
-            if participant.assignment in counts:
-                counts[participant.assignment] += 1
+        # tally novices and role counts in a single sweep of the heat
+        participants = heat.participants
+        novices = 0
+        counts = [0] * len(SUMMARY_ROLES)
+        for participant in participants:
+            if participant.novice:
+                novices += 1
+            role_id = SUMMARY_ROLE_IDS.get(participant.assignment)
+            if role_id is not None:
+                counts[role_id] += 1
 
         summary_data.append(
             [
                 str(idx),
-                str(counts["instructor"]),
-                str(counts["timing"]),
-                str(counts["grid"]),
-                str(counts["start"]),
-                str(counts["captain"]),
-                str(counts["worker"]),
-                str(counts["special"]),
-                f"{str(len(heat.participants))} ({novices} Novices)",
+                *map(str, counts),
+                f"{len(participants)} ({novices} Novices)",
             ]
         )
 
@@ -216,83 +252,123 @@ def _build_summary_table(event, available_width):
         total_width=available_width,
     )
     summary_table = Table(summary_data, colWidths=col_widths, repeatRows=1)
-    summary_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), FONT_NAME_BOLD),
-                ("FONTNAME", (0, 1), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
-            ]
-        )
-    )
+    summary_table.setStyle(TableStyle(BASE_TABLE_STYLE))
     return summary_table
 
 
-def _build_grid_worker_table(event, available_width):
-    """Build the run-group grid table sorted by class and number (no assignment column)."""
-
-    grid_worker_headers = ["heat", "name", "class", "number", "tally"]
-    display_grid_worker_headers = ["Running", "Name", "Class", "Number", "Run Tally"]
+def _build_grid_worker_tables(run_assignments, available_width):
+    """Build the run-group grid table from run rows already sorted by heat, class, and number.
 
-    sorted_assignments = sorted(
-        event.get_run_assignments(),
-        key=lambda row: (row["heat"], row["class"], row["number"]),
-    )
+    Returns:
+        list[Table]: The table, split into chunks when it is long.
+    """
 
-    table_data = [display_grid_worker_headers] + [
-        [str(row[h]).upper() for h in grid_worker_headers] for row in sorted_assignments
-    ]
-    col_widths = _compute_scaled_col_widths(
-        data=table_data,
+    table_data, max_widths = _build_rows_and_widths(
+        rows=run_assignments,
+        headers=GRID_WORKER_HEADERS,
+        display_headers=GRID_WORKER_DISPLAY_HEADERS,
         font_name=FONT_NAME,
         font_size=FONT_SIZE,
-        padding=CELL_PADDING,
-        total_width=available_width,
     )
+    col_widths = _scale_widths(max_widths, CELL_PADDING, available_width)
 
-    grid_worker_table = Table(
-        table_data,
-        colWidths=col_widths,
-        repeatRows=1,
+    style = TableStyle(
+        [
+            *BASE_TABLE_STYLE,
+            ("ALIGN", (GRID_WORKER_NAME_IDX, 1), (GRID_WORKER_NAME_IDX, -1), "LEFT"),
+        ]
     )
-    name_idx = grid_worker_headers.index("name")
+    return _build_chunked_tables(table_data, col_widths, style)
 
-    grid_worker_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("ALIGN", (name_idx, 1), (name_idx, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), FONT_NAME_BOLD),
-                ("FONTNAME", (0, 1), (-1, -1), FONT_NAME),
-                ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
-            ]
+
+def _build_chunked_tables(table_data, col_widths, style):
+    """Split table data into independent tables of at most TABLE_CHUNK_ROWS body rows.
+
+    Each chunk repeats the header row, so page splits only ever re-lay out one chunk.
+
+    Returns:
+        list[Table]: Styled tables in row order; a single table when the data fits in one chunk.
+    """
+
+    header, body = table_data[0], table_data[1:]
+    tables = []
+    for start in range(0, max(len(body), 1), TABLE_CHUNK_ROWS):
+        table = Table(
+            [header] + body[start : start + TABLE_CHUNK_ROWS],
+            colWidths=col_widths,
+            repeatRows=1,
         )
-    )
-    return grid_worker_table
+        table.setStyle(style)
+        tables.append(table)
+    return tables
 
 
 def _compute_scaled_col_widths(data, font_name, font_size, padding, total_width):
     """Compute column widths scaled to fit the available page width to avoid overflow or truncation."""
 
-    num_cols = len(data[0])
-    max_widths = [0] * num_cols
-    for row in data:
-        for idx, cell in enumerate(row):
-            text = str(cell)
-            width = stringWidth(text, font_name, font_size)
-            max_widths[idx] = max(max_widths[idx], width)
+    max_widths = _measure_columns(data, font_name, font_size)
+    return _scale_widths(max_widths, padding, total_width)
+
+
+def _build_rows_and_widths(rows, headers, display_headers, font_name, font_size):
+    """Stringify table rows and measure the widest cell in each column.
+
+    Returns:
+        tuple[list[list[str]], list[float]]: Table data including the header row, and the
+        maximum text width of each column.
+    """
+
+    table_data = [list(display_headers)] + [
+        [str(row[h]).upper() for h in headers] for row in rows
+    ]
+    return table_data, _measure_columns(table_data, font_name, font_size)
+
+
+def _measure_columns(data, font_name, font_size):
+    """Return the widest text width in each column of stringified table data."""
+
+    if font_name in MONOSPACE_FONTS:
+        return [
+            _measure_monospace_column(column, font_name, font_size)
+            for column in zip(*data)
+        ]
+
+    # a per-column max over finished rows runs in C and beats updating maxima cell by cell;
+    # cells repeat heavily (heats, classes, roles), so each distinct string is measured once
+    return [
+        max(_cached_string_width(cell, font_name, font_size) for cell in set(column))
+        for column in zip(*data)
+    ]
+
+
+def _measure_monospace_column(column, font_name, font_size):
+    """Measure a Courier column by character count, deferring to font metrics for other glyphs."""
+
+    # one joined string checks the whole column for non-uniform glyphs in a single C call
+    joined = "".join(column)
+    if not (joined.isascii() and joined.isprintable()):
+        return max(
+            _cached_string_width(cell, font_name, font_size) for cell in set(column)
+        )
+    # same operation order as reportlab's metric sum so widths match stringWidth exactly
+    return max(map(len, column)) * MONOSPACE_GLYPH_WIDTH * 0.001 * font_size
+
+
+def _scale_widths(max_widths, padding, total_width):
+    """Pad measured column widths and scale them to fill the available page width."""
+
     raw_widths = [width + padding for width in max_widths]
     raw_total = sum(raw_widths)
     return [width * total_width / raw_total for width in raw_widths]
 
 
+@lru_cache(maxsize=4096)
+def _cached_string_width(text, font_name, font_size):
+    """Measure text width, memoized because table cells repeat heavily across rows and tables."""
+
+    return stringWidth(text, font_name, font_size)
+
+
 class NumberedCanvas(canvas.Canvas):
     """Canvas subclass that prints 'Page X of Y' in the footer."""
 
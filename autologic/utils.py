@@ -1,9 +1,15 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 # TODO: make these configurable
 MIN_INSTRUCTOR_PER_HEAT = 3  # this is modified in roles_and_minima()
 MIN_TIMING_PER_HEAT = 2
 MIN_START_PER_HEAT = 1
 MIN_GRID_PER_HEAT = 2
 
+# keys of Event.get_work_assignments rows, in worker CSV and PDF column order
+WORK_ASSIGNMENT_FIELDS = ("heat", "name", "class", "number", "assignment", "checked_in")
+
 
 def sort_dict_by_value(d: dict, ascending: bool = True) -> dict:
     """
@@ -47,13 +53,11 @@ def sort_dict_by_nested_keys(d, keys_with_order):
     """
     items = list(d.items())
 
+    # timsort reuses the runs left by earlier passes, so this chain beats one tuple-key
+    # sort; resolve each key's fallback once rather than on every key call
     for key, ascending in reversed(keys_with_order):
-        items.sort(
-            key=lambda item: item[1].get(
-                key, float("-inf") if not ascending else float("inf")
-            ),
-            reverse=not ascending,
-        )
+        missing = float("inf") if ascending else float("-inf")
+        items.sort(key=lambda item: item[1].get(key, missing), reverse=not ascending)
 
     return dict(items)
 
@@ -65,12 +69,10 @@ def get_max_role_str_length():
     Returns:
         int: Length of the longest role name in the event.
     """
-    max_length = 0
-    for r in roles_and_minima("_"):
-        max_length = len(r) if len(r) > max_length else max_length
-    return max_length
+    return MAX_ROLE_STR_LENGTH
 
 
+@lru_cache(maxsize=128)
 def roles_and_minima(number_of_stations=4, number_of_novices=1, novice_denominator=3):
     """
     Roles and their minimum required number of individuals per heat.
@@ -86,19 +88,28 @@ def roles_and_minima(number_of_stations=4, number_of_novices=1, novice_denominat
         number_of_novices (int): Number of novices in the complimentary heat.
         novice_denominator (int): Ratio of novices to instructors.
 
+    Results are memoized, since validation and heat generation ask for the same few
+    combinations for every heat. The cached mapping is shared, so it is returned read-only.
+
     Returns:
-        dict: Role names and their minimum number of individuals per heat.
+        MappingProxyType: Role names and their minimum number of individuals per heat.
     """
 
-    return {
-        "instructor": max(
-            MIN_INSTRUCTOR_PER_HEAT, round(number_of_novices / novice_denominator)
-        ),
-        "timing": MIN_TIMING_PER_HEAT,
-        "grid": MIN_GRID_PER_HEAT,
-        "start": MIN_START_PER_HEAT,
-        "captain": number_of_stations,
-    }
+    return MappingProxyType(
+        {
+            "instructor": max(
+                MIN_INSTRUCTOR_PER_HEAT, round(number_of_novices / novice_denominator)
+            ),
+            "timing": MIN_TIMING_PER_HEAT,
+            "grid": MIN_GRID_PER_HEAT,
+            "start": MIN_START_PER_HEAT,
+            "captain": number_of_stations,
+        }
+    )
+
+
+# role names are fixed, so their longest length is computed once at import
+MAX_ROLE_STR_LENGTH = max(len(role) for role in roles_and_minima())
 
 
 def normalize_custom_assignments(
@@ -1,4 +1,6 @@
 import csv
+import os
+import pickle
 import queue
 import shutil
 import time
@@ -72,6 +74,13 @@ class FileDialogRecorder:
         return ""
 
 
+class UnsafePicklePayload:
+    """Pickle a shell call, as a tampered event file would."""
+
+    def __reduce__(self):
+        return (os.system, ("echo autologic-unsafe-pickle",))
+
+
 def wait_for_generation(
     gui_controller: AutologicGUI, timeout_seconds: float = 30
 ) -> None:
@@ -1089,6 +1098,15 @@ def test_step12_load_pickle(state_path: Path, monkeypatch):
         gui_controller._load_event_prompt()
         assert messagebox_recorder.errors
 
+        # pickle referencing a non-autologic global should be refused before it runs
+        messagebox_recorder.reset()
+        unsafe_pickle_path = pickle_path.parent / "unsafe.pkl"
+        unsafe_pickle_path.write_bytes(pickle.dumps(UnsafePicklePayload()))
+        filedialog_recorder.open_paths.append(unsafe_pickle_path)
+        gui_controller._load_event_prompt()
+        assert messagebox_recorder.errors
+        assert "Unsupported object in event file" in messagebox_recorder.errors[-1][1]
+
         # valid pickle load should restore state
         messagebox_recorder.reset()
         filedialog_recorder.open_paths.append(pickle_path)